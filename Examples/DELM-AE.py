@@ -18,6 +18,7 @@ y = df.values[:, 0]
 label_encoder = LabelEncoder()
 y = label_encoder.fit_transform(y)  # Encode class labels to numerical values
 X = preprocessing.normalize(X)  # Normalize feature vectors
+X = X.astype(np.float32, copy=False)  # Cast features once to the float32 used by the layers
 
 # Create an instance of the Multilayer ELM model as an autoencoder for feature mapping
 model = ML_ELMModel(verbose=0, classification=False)
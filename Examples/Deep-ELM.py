@@ -23,6 +23,7 @@ y = df.values[:, 0]
 label_encoder = LabelEncoder()
 y = label_encoder.fit_transform(y)  # Encode class labels to numerical values
 X = preprocessing.normalize(X)  # Normalize feature vectors
+X = X.astype(np.float32, copy=False)  # Cast features once to the float32 used by the layers
 
 # Initialize a ReceptiveFieldGenerator with input size (28, 28, 1) and 10 output classes
 rf = ReceptiveFieldGenerator(input_size=(28, 28, 1), num_classes=10)
@@ -1,3 +1,5 @@
+import os
+
 import numpy as np
 import pandas as pd
 from keras.utils import to_categorical
@@ -26,6 +28,7 @@ y = df.values[:, 0]
 label_encoder = LabelEncoder()
 y = label_encoder.fit_transform(y)  # Encode class labels to numerical values
 X = preprocessing.normalize(X)  # Normalize feature vectors
+X = X.astype(np.float32, copy=False)  # Cast features once to the float32 used by the layers
 
 X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
 y_train_cat = to_categorical(y_train)
@@ -43,7 +46,13 @@ model.add(ELMLayer(number_neurons=num_neurons, activation='identity'))
 cv = RepeatedKFold(n_splits=n_splits, n_repeats=n_repeats)
 
 # Perform cross-validation to evaluate the model performance
-scores = cross_val_score(model, X, y, cv=cv, scoring='accuracy', error_score='raise')
+# Limit the TensorFlow thread pools of the worker processes spawned for the parallel cross-validation, so that
+# the folds evaluated simultaneously do not oversubscribe the CPU cores
+os.environ["TF_NUM_INTRAOP_THREADS"] = "2"
+os.environ["TF_NUM_INTEROP_THREADS"] = "1"
+scores = cross_val_score(model, X, y, cv=cv, scoring='accuracy', error_score='raise', n_jobs=-1,
+                         pre_dispatch='2*n_jobs')
+del os.environ["TF_NUM_INTRAOP_THREADS"], os.environ["TF_NUM_INTEROP_THREADS"]
 
 # Print the mean accuracy score obtained from cross-validation
 print(np.mean(scores))
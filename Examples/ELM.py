@@ -7,6 +7,7 @@ from sklearn import preprocessing
 
 from Layers.ELMLayer import ELMLayer
 from Models.ELMModel import ELMModel
+from Resources.batched_cross_val_score import batched_cross_val_score
 
 
 # Hyperparameters:
@@ -24,6 +25,7 @@ y = df.values[:, 0]
 label_encoder = LabelEncoder()
 y = label_encoder.fit_transform(y)  # Encode class labels to numerical values
 X = preprocessing.normalize(X)  # Normalize feature vectors
+X = X.astype(np.float32, copy=False)  # Cast features once to the float32 used by the layers
 
 # Initialize an Extreme Learning Machine (ELM) layer
 elm = ELMLayer(number_neurons=num_neurons, activation='mish')
@@ -40,6 +42,10 @@ scores = cross_val_score(model, X, y, cv=cv, scoring='accuracy', error_score='ra
 # Print the mean accuracy score obtained from cross-validation
 print(np.mean(scores))
 
+# Perform the same cross-validation with the output weights of 10 folds solved at once by batched operations
+scores = batched_cross_val_score(elm, X, y, cv=cv, batch_size=10)
+print(np.mean(scores))
+
 # Fit the ELM model to the entire dataset
 model.fit(X, y)
 
@@ -24,6 +24,7 @@ y = df.values[:, 0]
 label_encoder = LabelEncoder()
 y = label_encoder.fit_transform(y)  # Encode class labels to numerical values
 X = preprocessing.normalize(X)  # Normalize feature vectors
+X = X.astype(np.float32, copy=False)  # Cast features once to the float32 used by the layers
 
 # Initialize a Kernel (it can be instanced as Kernel class and its subclasses like CombinedProductKernel)
 kernel = CombinedProductKernel([Kernel("rational_quadratic"), Kernel("exponential")])
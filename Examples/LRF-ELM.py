@@ -30,6 +30,7 @@ y = df.values[:, 0]
 label_encoder = LabelEncoder()
 y = label_encoder.fit_transform(y)
 X = preprocessing.normalize(X)
+X = X.astype(np.float32, copy=False)  # Cast features once to the float32 used by the layers
 
 # Split the dataset into training and testing sets
 X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
@@ -24,6 +24,7 @@ y = df.values[:, 0]
 label_encoder = LabelEncoder()
 y = label_encoder.fit_transform(y)  # Encode class labels to numerical values
 X = preprocessing.normalize(X)  # Normalize feature vectors
+X = X.astype(np.float32, copy=False)  # Cast features once to the float32 used by the layers
 
 # Initialize an Extreme Learning Machine (ELM) layer
 layer = ELMLayer(number_neurons=num_neurons, activation='tanh')
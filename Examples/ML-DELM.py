@@ -1,3 +1,5 @@
+import os
+
 import numpy as np
 import pandas as pd
 from keras.utils import to_categorical
@@ -21,6 +23,7 @@ y = df.values[:, 0]
 label_encoder = LabelEncoder()
 y = label_encoder.fit_transform(y)  # Encode class labels to numerical values
 X = preprocessing.normalize(X)  # Normalize feature vectors
+X = X.astype(np.float32, copy=False)  # Cast features once to the float32 used by the layers
 
 # Initialize a Multilayer Extreme Learning Machine model
 model = ML_ELMModel(verbose=0)
@@ -48,7 +51,13 @@ n_repeats = 10
 cv = RepeatedKFold(n_splits=n_splits, n_repeats=n_repeats)
 
 # Perform cross-validation to evaluate the model performance
-scores = cross_val_score(model, X, y, cv=cv, scoring='accuracy', error_score='raise')
+# Limit the TensorFlow thread pools of the worker processes spawned for the parallel cross-validation, so that
+# the folds evaluated simultaneously do not oversubscribe the CPU cores
+os.environ["TF_NUM_INTRAOP_THREADS"] = "2"
+os.environ["TF_NUM_INTEROP_THREADS"] = "1"
+scores = cross_val_score(model, X, y, cv=cv, scoring='accuracy', error_score='raise', n_jobs=-1,
+                         pre_dispatch='2*n_jobs')
+del os.environ["TF_NUM_INTRAOP_THREADS"], os.environ["TF_NUM_INTEROP_THREADS"]
 
 # Print the mean accuracy score obtained from cross-validation
 print(np.mean(scores))
@@ -20,6 +20,7 @@ y = df.values[:, 0]
 label_encoder = LabelEncoder()
 y = label_encoder.fit_transform(y)
 X = preprocessing.normalize(X)
+X = X.astype(np.float32, copy=False)  # Cast features once to the float32 used by the layers
 observations, features = X.shape
 
 # Initialize Multilayer ELM model
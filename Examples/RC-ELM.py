@@ -21,6 +21,7 @@ y = df.values[:, -1]
 
 # Preprocess data
 X = preprocessing.normalize(X)
+X = X.astype(np.float32, copy=False)  # Cast features once to the float32 used by the layers
 y = y.reshape(-1, 1)
 X_test = np.array([0, 0.455, 0.365, 0.095, 0.514, 0.2245, 0.101, 0.15])
 X_test = X_test.reshape(1, -1)
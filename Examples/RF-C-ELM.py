@@ -25,6 +25,7 @@ y = df.values[:, 0]
 label_encoder = LabelEncoder()
 y = label_encoder.fit_transform(y)  # Encode class labels to numerical values
 X = preprocessing.normalize(X)  # Normalize feature vectors
+X = X.astype(np.float32, copy=False)  # Cast features once to the float32 used by the layers
 
 # Initialization of Receptive Field Generator
 rf = ReceptiveFieldGaussianGenerator(input_size=(28, 28, 1))
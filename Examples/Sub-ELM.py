@@ -17,6 +17,7 @@ y = df.values[:, 0]
 label_encoder = LabelEncoder()
 y = label_encoder.fit_transform(y)
 X = preprocessing.normalize(X)
+X = X.astype(np.float32, copy=False)  # Cast features once to the float32 used by the layers
 
 # Initialize a Subnetwork Extreme Learning Machine (SubELM) layer
 layer = SubELMLayer(1000, 200, 70, 'mish')
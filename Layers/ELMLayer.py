@@ -1,13 +1,169 @@
 from Optimizers.ELMOptimizer import ELMOptimizer
 from Resources.ActivationFunction import ActivationFunction
+from functools import lru_cache
+from types import FunctionType
+
+import numpy as np
 import tensorflow as tf
 
 from Resources.generate_contrainted_weights import generate_contrainted_weights
-from Resources.gram_schmidt import gram_schmidt
+from Resources.randomized_svd import randomized_svd
 from Resources.ReceptiveFieldGenerator import ReceptiveFieldGenerator
 from Resources.ReceptiveFieldGaussianGenerator import ReceptiveFieldGaussianGenerator
 
 
+@lru_cache(maxsize=None)
+def _device():
+    # The first GPU if available, so that the matmuls and factorizations of the layer run on cuBLAS and cuSOLVER
+    return '/GPU:0' if tf.config.list_physical_devices('GPU') else '/CPU:0'
+
+
+_ACTIVATIONS = {name: member for name, member in vars(ActivationFunction).items()
+                if not name.startswith('_') and isinstance(member, (staticmethod, FunctionType))}
+_RF_CLASSES = {
+    "ReceptiveFieldGenerator": ReceptiveFieldGenerator,
+    "ReceptiveFieldGaussianGenerator": ReceptiveFieldGaussianGenerator,
+}
+
+# ActivationFunction instances shared between layers, keyed by (act_param, act_param2, knots)
+_ACT_CACHE = {}
+# Bound activation functions shared between layers, keyed by (activation name, act_param, act_param2, knots)
+_BOUND_ACTIVATIONS = {}
+
+
+def _activation_key(act_params):
+    """
+        Validates the parameters of the activation function and derives the ActivationFunction arguments from them.
+
+        Parameters:
+        -----------
+        - act_params (dict): Parameters of the activation function or None for the defaults.
+
+        Returns:
+        -----------
+        tuple: Keyword arguments of ActivationFunction and the key (act_param, act_param2, knots) identifying them,
+        or None as key if the parameters are not hashable, e.g. tensors, arrays or nested lists.
+    """
+    if act_params is None:
+        kwargs = {}
+    elif "act_param" in act_params and "act_param2" in act_params:
+        kwargs = {"act_param": act_params["act_param"], "act_param2": act_params["act_param2"]}
+    elif "act_param" in act_params:
+        kwargs = {"act_param": act_params["act_param"]}
+    elif "knots" in act_params:
+        kwargs = {"knots": act_params["knots"]}
+    else:
+        raise Exception("TypeError: Wrong specified activation function parameters")
+    knots = kwargs.get("knots")
+    key = (kwargs.get("act_param", 1.0), kwargs.get("act_param2", 1.0), None if knots is None else tuple(knots))
+    try:
+        hash(key)
+    except TypeError:
+        key = None
+    return kwargs, key
+
+
+def _activation_function(act_params):
+    """
+        Returns the ActivationFunction for the given parameters, shared between all layers with equal parameters.
+
+        Parameters:
+        -----------
+        - act_params (dict): Parameters of the activation function or None for the defaults.
+
+        Returns:
+        -----------
+        ActivationFunction: The shared instance, or a new one if the parameters are not hashable.
+    """
+    kwargs, key = _activation_key(act_params)
+    if key is None:
+        return ActivationFunction(**kwargs)
+    if key not in _ACT_CACHE:
+        _ACT_CACHE[key] = ActivationFunction(**kwargs)
+    return _ACT_CACHE[key]
+
+
+def _bound_activation(activation, act_params):
+    """
+        Returns the activation function of the given name bound to its parameters. Equal names and parameters always
+        give the same function object, including for layers copied by sklearn clone or unpickled by joblib, so that
+        the compiled kernels, which are traced per activation function object, are reused instead of retraced.
+
+        Parameters:
+        -----------
+        - activation (str): Name of the activation function in ActivationFunction.
+        - act_params (dict): Parameters of the activation function or None for the defaults.
+
+        Returns:
+        -----------
+        callable: The activation function.
+    """
+    if activation not in _ACTIVATIONS:
+        raise Exception(f"ValueError: Unknown activation function '{activation}'")
+    _, key = _activation_key(act_params)
+    if key is None:
+        return _ACTIVATIONS[activation].__get__(_activation_function(act_params), ActivationFunction)
+    if (activation,) + key not in _BOUND_ACTIVATIONS:
+        act = _activation_function(act_params)
+        _BOUND_ACTIVATIONS[(activation,) + key] = _ACTIVATIONS[activation].__get__(act, ActivationFunction)
+    return _BOUND_ACTIVATIONS[(activation,) + key]
+
+
+@tf.function(jit_compile=True, reduce_retracing=True)
+def _fused_forward(x, alpha, bias, activation):
+    # Module level so that the compiled kernel is shared between layers using the same activation function
+    return activation(tf.matmul(x, alpha) + bias)
+
+
+@tf.function(jit_compile=True, reduce_retracing=True)
+def _fused_predict(x, alpha, bias, beta, activation):
+    # The whole chain f(x alpha + bias) beta in one kernel, the feature map is never returned as an intermediate
+    return tf.matmul(activation(tf.matmul(x, alpha) + bias), beta)
+
+
+@tf.function(jit_compile=True, reduce_retracing=True)
+def _fused_activation(x, activation):
+    # The activation function is resolved once at trace time instead of being dispatched from Python on every call
+    return activation(x)
+
+
+@tf.function(jit_compile=True, reduce_retracing=True)
+def _fused_chain(x, betas_t, activations):
+    # The outputs of a stack of layers in one kernel, XLA reuses the buffers of the intermediate outputs in place.
+    # Layers with the identity activation are linear, so their products are deferred up to the next nonlinear layer
+    # and the whole linear segment is contracted at once in the cheapest order planned by einsum.
+    linear = []
+    for beta_t, activation in zip(betas_t, activations):
+        linear.append(beta_t)
+        if activation is not ActivationFunction.identity:
+            x = activation(_contract(tf.cast(x, beta_t.dtype), linear))
+            linear = []
+    if linear:
+        x = _contract(tf.cast(x, linear[-1].dtype), linear)
+    return tf.cast(x, tf.float32)
+
+
+def _contract(x, matrices):
+    """
+        Multiplies the input by a sequence of matrices, contracting them with einsum in the cheapest order if there
+        are more than one.
+
+        Parameters:
+        -----------
+        - x (tf.Tensor): Input tensor of shape (N, D).
+        - matrices (list): Matrices applied in turn, the first with D rows.
+
+        Returns:
+        -----------
+        tf.Tensor: The product of the input and all matrices.
+    """
+    if len(matrices) == 1:
+        return tf.matmul(x, matrices[0])
+    indices = [chr(ord('b') + i) for i in range(len(matrices) + 1)]
+    operands = ','.join(['a' + indices[0]] + [indices[i] + indices[i + 1] for i in range(len(matrices))])
+    return tf.einsum(f"{operands}->a{indices[-1]}", x, *[tf.cast(m, x.dtype) for m in matrices], optimize='greedy')
+
+
 class ELMLayer:
     """
         Extreme Learning Machine Layer with various variants.
@@ -25,8 +181,10 @@ class ELMLayer:
         act_params : dict, default=None
             Additional parameters for the activation function (if needed - see implementation of particular function in
             class Activation).
-        C : float, default=None
-            Regularization parameter to control the degree of regularization applied to the hidden layer.
+        C : float, default=0.0
+            Tikhonov (ridge) regularization parameter added to the diagonal of the Gram matrix of the feature map when
+            solving for the output weights, i.e. beta = (H^T H + C I)^-1 H^T T. If 0.0 or None the Moore-Penrose
+            pseudoinverse is used.
         beta_optimizer : ELMOptimizer, default=None
             An optimizer to optimize the output weights (beta) of the layer applied after the Moore-Penrose operation to
             finetune the beta parameter based on provided to optimizer loss function and optimization algorithm.
@@ -35,6 +193,20 @@ class ELMLayer:
             is performed (recommended to be applied for multilayer variants of ELM).
         receptive_field_generator : ReceptiveFieldGenerator, default=None
             An object for generating receptive fields to constrain the input weights of the hidden neurons.
+        rank : int, default=None
+            Target rank of the randomized truncated SVD used in place of the Moore-Penrose pseudoinverse, recommended
+            for wide layers whose feature map has a low effective rank. If None the full pseudoinverse is computed.
+        dtype : tf.DType or str, default=tf.float32
+            The data type of the weights and of the feature map computation, e.g. tf.bfloat16 to halve the memory
+            traffic of large layers. The output weights are always solved in float32 for numerical stability and the
+            outputs of the layer are returned as float32.
+        seed : int, default=None
+            Seed of the random input weights and bias, if set every build of the layer generates the same weights. It
+            also seeds the random sketch of the randomized truncated SVD, so that fitting is deterministic as well.
+        cache_factorization : bool, default=False
+            If True the feature map and its factorization are kept after fitting and reused when the same input
+            tensor is fitted again with different targets. This trades the memory of the factorization, e.g. the
+            pseudoinverse of the feature map, for faster refits and is therefore disabled by default.
         **params : dict
             Additional parameters to be passed to the layer.
 
@@ -62,6 +234,14 @@ class ELMLayer:
             The optimizer used to optimize the output weights (beta) of the layer.
         is_orthogonalized : bool
             Indicates whether the input weights of the hidden neurons are orthogonalized.
+        rank : int or None
+            Target rank of the randomized truncated SVD used to compute the output weights.
+        dtype : tf.DType
+            The data type of the weights and of the feature map computation.
+        seed : int or None
+            Seed of the random input weights and bias.
+        cache_factorization : bool
+            Indicates whether the factorization of the last fitted feature map is kept for refitting.
         denoising : str or None
             The type of denoising applied to the layer passed as additional parameter to the constructor, it
             applies a given denoising algorithm to the input data to make classification more robust.
@@ -93,6 +273,11 @@ class ELMLayer:
 
         >>> elm = ELMLayer(number_neurons=100, activation='mish', beta_optimizer=optimizer)
 
+        Initialize an Extreme Learning Machine (ELM) layer with 1000 neurons whose output weights are computed by the
+        randomized truncated SVD of rank 100 instead of the full Moore-Penrose pseudoinverse
+
+        >>> elm = ELMLayer(number_neurons=1000, activation='mish', rank=100)
+
         Initialize a Receptive Field Extreme Learning Machine (ELM) layer with Receptive Field Generator
 
         >>> rf = ReceptiveFieldGaussianGenerator(input_size=(28, 28, 1))
@@ -125,6 +310,10 @@ class ELMLayer:
                  beta_optimizer: ELMOptimizer = None,
                  is_orthogonalized=False,
                  receptive_field_generator=None,
+                 rank=None,
+                 dtype=tf.float32,
+                 seed=None,
+                 cache_factorization=False,
                  **params):
         self.error_history = None
         self.feature_map = None
@@ -137,28 +326,26 @@ class ELMLayer:
         self.act_params = act_params
         self.beta_optimizer = beta_optimizer
         self.is_orthogonalized = is_orthogonalized
-        if act_params is None:
-            act = ActivationFunction(1.0)
-        elif "act_param" in act_params and "act_param2" in act_params:
-            act = ActivationFunction(act_param=act_params["act_param"], act_param2=act_params["act_param2"])
-        elif "act_param" in act_params:
-            act = ActivationFunction(act_param=act_params["act_param"])
-        elif "knots" in act_params:
-            act = ActivationFunction(knots=act_params["knots"])
-        else:
-            raise Exception("TypeError: Wrong specified activation function parameters")
         self.activation_name = activation
-        self.activation = eval("act." + activation)
+        self.activation = _bound_activation(activation, act_params)
         self.number_neurons = number_neurons
         self.C = C
         self.receptive_field_generator = receptive_field_generator
+        self.rank = rank
+        self.dtype = tf.as_dtype(dtype)
+        self.seed = seed
+        self.cache_factorization = cache_factorization
+        # (key, feature map, solver) of the last fitted input tensor, if cache_factorization is set
+        self._cache = None
+        # (beta, transposed beta) used by calc_output
+        self._beta_T = None
 
         if "beta" in params:
-            self.beta = params.pop("beta")
+            self.beta = tf.cast(params.pop("beta"), self.dtype)
         if "alpha" in params:
-            self.alpha = params.pop("alpha")
+            self.alpha = tf.cast(params.pop("alpha"), self.dtype)
         if "bias" in params:
-            self.bias = params.pop("bias")
+            self.bias = tf.cast(params.pop("bias"), self.dtype)
 
         if "denoising" in params:
             self.denoising = params.pop("denoising")
@@ -175,7 +362,7 @@ class ELMLayer:
             self.constrained = False
 
         if 'rf_name' in params:
-            rf = eval(f"{params['rf_name']}.load(params)")
+            rf = _RF_CLASSES[params['rf_name']].load(params)
             self.receptive_field_generator = rf
 
     def build(self, input_shape):
@@ -195,22 +382,41 @@ class ELMLayer:
             >>> elm = ELMLayer(number_neurons=1000, activation='mish')
             >>> elm.build(x.shape)
         """
-        alpha = input_shape[-1]
-        alpha_initializer = tf.random_uniform_initializer(-1, 1)
-        self.alpha = tf.Variable(
-            alpha_initializer(shape=(alpha, self.number_neurons)),
-            dtype=tf.float32,
-            trainable=False
-        )
-        bias_initializer = tf.random_uniform_initializer(0, 1)
-        self.bias = tf.Variable(
-            bias_initializer(shape=(self.number_neurons,)),
-            dtype=tf.float32,
-            trainable=False
-        )
-        if self.is_orthogonalized:
-            self.alpha = gram_schmidt(self.alpha)
-            self.bias = self.bias / tf.norm(self.bias)
+        self._cache = None
+        with tf.device(_device()):
+            alpha = input_shape[-1]
+            self.alpha = self._random_uniform((alpha, self.number_neurons), -1, 1, 0)
+            if self.is_orthogonalized and alpha < self.number_neurons:
+                # More neurons than features, the columns cannot be orthogonal, hence the rows are orthonormalized
+                q, _ = tf.linalg.qr(tf.transpose(self.alpha))
+                self.alpha = tf.transpose(q)
+            elif self.is_orthogonalized:
+                self.alpha, _ = tf.linalg.qr(self.alpha)
+            self.bias = self._random_uniform((self.number_neurons,), 0, 1, 1)
+            if self.is_orthogonalized:
+                self.bias = tf.math.l2_normalize(self.bias)
+            self.alpha = tf.cast(self.alpha, self.dtype)
+            self.bias = tf.cast(self.bias, self.dtype)
+
+    def _random_uniform(self, shape, minval, maxval, stream):
+        """
+            Draws uniformly distributed random weights, deterministically if a seed of the layer is set.
+
+            Parameters:
+            -----------
+            - shape (tuple): The shape of the weights.
+            - minval (float): The lower bound of the distribution.
+            - maxval (float): The upper bound of the distribution.
+            - stream (int): The index of the random stream, distinguishing the draws of a single build.
+
+            Returns:
+            -----------
+            tf.Tensor: Random weights of dtype float32.
+        """
+        if self.seed is None:
+            return tf.random.uniform(shape, minval, maxval, dtype=tf.float32)
+        return tf.random.stateless_uniform(shape, seed=[self.seed, stream], minval=minval, maxval=maxval,
+                                           dtype=tf.float32)
 
     def fit(self, x, y):
         """
@@ -232,14 +438,16 @@ class ELMLayer:
         After generating the feature map (H) using the input data (x) and hidden layer weights (alpha) along with the bias, the method applies the specified activation function to the feature map.
         :math:`H = f(x \\cdot \\alpha + bias)`
 
-        If a regularization term (C) is provided, it is added to the diagonal of the feature map matrix.
-        :math:`H = H + diag(C)`
-
         The output weights (beta) are computed using the Moore-Penrose pseudoinverse of the feature map matrix and the target output data (y). If a beta optimizer is specified, it further optimizes the output weights.
-        :math:`H = H + diag(C)`
+        :math:`\\beta = H^{\\dagger} T`
+
+        If a regularization term (C) is provided, it is applied as a Tikhonov (ridge) penalty and the regularized normal equations are solved through the Cholesky factorization of the Gram matrix instead, falling back to the pseudoinverse if the factorization fails.
+        :math:`\\beta = (H^T H + C I)^{-1} H^T T`
+
+        If a rank is provided, the pseudoinverse is replaced by the randomized truncated SVD of the feature map.
+        :math:`\\beta = V_r (S_r^2 + C I)^{-1} S_r U_r^T T`
 
         The feature map (H) and the output (Beta) are stored as attributes of the model for later use.
-        :math:`\\beta = H^{\\dagger} T`
 
         If a beta optimizer is provided, the method returns the optimized beta and the error history.
 
@@ -249,31 +457,99 @@ class ELMLayer:
             >>> elm.build(x.shape)
             >>> elm.fit(train_data, train_targets)
         """
-        x = tf.cast(x, dtype=tf.float32)
-        y = tf.cast(y, dtype=tf.float32)
-        self.input = x
-
-        if self.constrained:
-            generate_contrainted_weights(x, y, self.number_neurons)
-        if self.receptive_field_generator is not None:
-            self.receptive_field_generator.generate_receptive_fields(self.alpha)
+        # The feature map and its factorization depend only on x, alpha and bias, so they are reused when the same
+        # input tensor is fitted again with different targets
+        if self.cache_factorization and all(isinstance(t, tf.Tensor) for t in (x, self.alpha, self.bias)):
+            key = (x.ref(), self.alpha.ref(), self.bias.ref(), self.C, self.rank, self.dtype)
+        else:
+            key = None
+
+        with tf.device(_device()):
+            x = tf.cast(x, dtype=self.dtype)
+            y = tf.cast(y, dtype=tf.float32)
+            self.input = x
+
+            if self.constrained:
+                generate_contrainted_weights(x, y, self.number_neurons)
+            if self.receptive_field_generator is not None:
+                self.receptive_field_generator.generate_receptive_fields(self.alpha)
+
+            if key is not None and self._cache is not None and self._cache[0] == key:
+                _, H, solve = self._cache
+            else:
+                H = self._forward(x)
+                solve = self._factorize(tf.cast(H, dtype=tf.float32))
+                self._cache = (key, H, solve) if key is not None else None
+            H32 = tf.cast(H, dtype=tf.float32)
+            beta = solve(y)
+
+            if self.beta_optimizer is not None:
+                beta, self.error_history = self.beta_optimizer.optimize(beta, H32, y)
+            self.beta = tf.cast(beta, dtype=self.dtype)
+            self._beta_T = (self.beta, tf.transpose(self.beta))
+
+            self.feature_map = H
+            self.output = tf.cast(tf.matmul(H, self.beta), dtype=tf.float32)
+
+    def _factorize(self, H):
+        """
+            Factorizes the feature map for the computation of the output weights, i.e. the randomized truncated SVD if
+            a rank is set, the Cholesky factorization of the Gram matrix if a regularization term is set and the
+            Moore-Penrose pseudoinverse otherwise or if the Cholesky factorization has failed.
 
-        H = tf.matmul(x, self.alpha) + self.bias
-        H = self.activation(H)
+            Parameters:
+            -----------
+            - H (tf.Tensor): Feature map tensor of shape (N, M).
 
-        if self.C is not None:
-            H = tf.linalg.set_diag(H, tf.linalg.diag_part(H) + self.C)
+            Returns:
+            -----------
+            callable: Function mapping the targets of shape (N, C) to the output weights of shape (M, C).
+        """
+        if self.rank is not None:
+            s, u, v = randomized_svd(H, self.rank, seed=self.seed)
+            # Same singular value cutoff as in tf.linalg.pinv
+            rcond = 10. * max(H.shape) * np.finfo(np.float32).eps
+            s = tf.where(s > rcond * tf.reduce_max(s), s, tf.zeros_like(s))
+            s_inv = tf.math.divide_no_nan(s, s ** 2 + (self.C or 0.0))
+            return lambda y: tf.matmul(v, s_inv[:, tf.newaxis] * tf.matmul(u, y, transpose_a=True))
+        if self.C:
+            solve = self._cholesky_factorize(H)
+            if solve is not None:
+                return solve
+        # The singular value cutoff of the pseudoinverse is what keeps the unregularized solution well-behaved for
+        # rank-deficient H, hence it remains the default and the fallback path
         pH = tf.linalg.pinv(H)
-        beta = tf.matmul(pH, y)
-        self.beta = beta
+        return lambda y: tf.matmul(pH, y)
 
-        if self.beta_optimizer is not None:
-            self.beta, self.error_history = self.beta_optimizer.optimize(beta, H, y)
-        else:
-            self.beta = beta
+    def _cholesky_factorize(self, H):
+        """
+            Computes the Cholesky factorization of the regularized Gram matrix of the feature map. The (M, M) Gram
+            matrix is used for tall feature maps and the (N, N) one for wide feature maps, so that the factorized matrix
+            is always the smaller one.
 
-        self.feature_map = H
-        self.output = tf.matmul(H, self.beta)
+            Parameters:
+            -----------
+            - H (tf.Tensor): Feature map tensor of shape (N, M).
+
+            Returns:
+            -----------
+            callable: Function mapping the targets of shape (N, C) to the output weights of shape (M, C) or None if the
+            factorization has failed.
+        """
+        n, m = H.shape
+        try:
+            if n >= m:
+                L = tf.linalg.cholesky(tf.matmul(H, H, transpose_a=True) + self.C * tf.eye(m, dtype=H.dtype))
+            else:
+                L = tf.linalg.cholesky(tf.matmul(H, H, transpose_b=True) + self.C * tf.eye(n, dtype=H.dtype))
+        except tf.errors.InvalidArgumentError:
+            return None
+        # On GPU a failed factorization does not raise but produces NaNs
+        if not tf.reduce_all(tf.math.is_finite(L)):
+            return None
+        if n >= m:
+            return lambda y: tf.linalg.cholesky_solve(L, tf.matmul(H, y, transpose_a=True))
+        return lambda y: tf.matmul(H, tf.linalg.cholesky_solve(L, y), transpose_a=True)
 
     def predict(self, x):
         """
@@ -294,11 +570,24 @@ class ELMLayer:
             >>> elm.fit(train_data, train_targets)
             >>> pred = elm.predict(test_data)
         """
-        x = tf.cast(x, dtype=tf.float32)
-        H = tf.matmul(x, self.alpha) + self.bias
-        H = self.activation(H)
-        output = tf.matmul(H, self.beta)
-        return output
+        x = tf.cast(x, dtype=self.dtype)
+        output = _fused_predict(x, self.alpha, self.bias, self.beta, self.activation)
+        return tf.cast(output, dtype=tf.float32)
+
+    def _forward(self, x):
+        """
+            Calculates the feature map of the hidden layer as a single XLA compiled kernel fusing the matrix
+            multiplication, bias addition and activation function.
+
+            Parameters:
+            -----------
+            - x (tf.Tensor): Input data tensor.
+
+            Returns:
+            -----------
+            tf.Tensor: Feature map tensor.
+        """
+        return _fused_forward(x, self.alpha, self.bias, self.activation)
 
     def predict_proba(self, x):
         """
@@ -319,12 +608,10 @@ class ELMLayer:
             >>> elm.fit(train_data, train_targets)
             >>> pred = elm.predict_proba(test_data)
         """
-        x = tf.cast(x, dtype=tf.float32)
         pred = self.predict(x)
         return tf.keras.activations.softmax(pred)
 
     def calc_output(self, x):
-        x = tf.cast(x, dtype=tf.float32)
         """
             Calculates the output of the ELM layer for the given input data.
     
@@ -336,10 +623,31 @@ class ELMLayer:
             -----------
             tf.Tensor: Output tensor.
         """
-        out = self.activation(tf.matmul(x, self.beta, transpose_b=True))
+        with tf.device(_device()):
+            out = _fused_chain(x, [self._transposed_beta()], [self.activation])
         self.output = out
         return out
 
+    @staticmethod
+    def calc_chain_output(layers, x):
+        """
+            Calculates the output of a stack of ELM layers for the given input data, equivalent to calling calc_output
+            of each layer in turn. The stack is evaluated as a single XLA compiled kernel, so the intermediate outputs
+            of the layers are neither materialized as separate tensors nor retained in the output attribute of the
+            layers. Consecutive layers with the identity activation are contracted together in the cheapest order.
+
+            Parameters:
+            -----------
+            - layers (list): ELM layers, in the order of application.
+            - x (tf.Tensor): Input data tensor.
+
+            Returns:
+            -----------
+            tf.Tensor: Output tensor of the last layer.
+        """
+        with tf.device(_device()):
+            return _fused_chain(x, [layer._transposed_beta() for layer in layers], [layer.activation for layer in layers])
+
     def apply_activation(self, x):
         """
             Applies activation function for the given input data.
@@ -352,7 +660,51 @@ class ELMLayer:
             -----------
             tf.Tensor: Output tensor.
         """
-        return self.activation(x)
+        if self.activation is ActivationFunction.identity:
+            return x
+        return _fused_activation(x, self.activation)
+
+    def __getstate__(self):
+        """
+            Returns the state of the ELM layer for pickling and copying, without the cached factorization of the
+            feature map which is bound to the fitted input tensor, without the transposed output weights which are
+            recomputed on demand and without the activation function which is looked up again on restoring.
+
+            Returns:
+            -----------
+            dict: State of the layer.
+        """
+        state = self.__dict__.copy()
+        state['_cache'] = None
+        state['_beta_T'] = None
+        del state['activation']
+        return state
+
+    def __setstate__(self, state):
+        """
+            Restores the state of the ELM layer, sharing the activation function of the layers with the same
+            activation, so that copies of the layer reuse the compiled kernels of the original.
+
+            Parameters:
+            -----------
+            - state (dict): State of the layer.
+        """
+        self.__dict__.update(state)
+        self.activation = _bound_activation(self.activation_name, self.act_params)
+
+    def _transposed_beta(self):
+        """
+            Returns the output weights transposed to shape (n_outputs, number_neurons) as a contiguous tensor, so that
+            calc_output is a plain matrix multiplication. The transpose is computed once and refreshed only when beta
+            is replaced, e.g. on loading or refitting.
+
+            Returns:
+            -----------
+            tf.Tensor: Transposed output weights.
+        """
+        if self._beta_T is None or self._beta_T[0] is not self.beta:
+            self._beta_T = (self.beta, tf.transpose(self.beta))
+        return self._beta_T[1]
 
     def __str__(self):
         """
@@ -396,11 +748,14 @@ class ELMLayer:
             - 'number_neurons': The number of neurons in the hidden layer.
             - 'activation': The activation function used in the hidden layer.
             - 'act_params': Additional parameters for the activation function.
-            - 'C': The regularization term applied to the feature map matrix.
+            - 'C': The Tikhonov regularization term applied to the Gram matrix of the feature map.
             - 'is_orthogonalized': A boolean indicating whether the hidden layer weights have been orthogonalized.
-            - 'beta': The output weights of the ELM layer.
-            - 'alpha': The hidden layer weights of the ELM layer.
-            - 'bias': The bias terms of the ELM layer.
+            - 'rank': The target rank of the randomized truncated SVD.
+            - 'dtype': The name of the data type of the layer computation.
+            - 'seed': The seed of the random input weights and bias.
+            - 'beta': The output weights of the ELM layer (stored as float32).
+            - 'alpha': The hidden layer weights of the ELM layer (stored as float32).
+            - 'bias': The bias terms of the ELM layer (stored as float32).
             - 'denoising': A boolean indicating whether denoising is applied to the input data.
             - 'denoising_param': Additional parameters for denoising.
 
@@ -413,9 +768,12 @@ class ELMLayer:
             'act_params': self.act_params,
             'C': self.C,
             'is_orthogonalized': self.is_orthogonalized,
-            "beta": self.beta,
-            "alpha": self.alpha,
-            "bias": self.bias,
+            'rank': self.rank,
+            'dtype': self.dtype.name,
+            'seed': self.seed,
+            "beta": None if self.beta is None else tf.cast(self.beta, dtype=tf.float32),
+            "alpha": None if self.alpha is None else tf.cast(self.alpha, dtype=tf.float32),
+            "bias": None if self.bias is None else tf.cast(self.bias, dtype=tf.float32),
             "denoising": self.denoising,
             "denoising_param": self.denoising_param,
         }
@@ -444,8 +802,11 @@ class ELMLayer:
             - 'number_neurons': The number of neurons in the hidden layer.
             - 'activation': The activation function used in the hidden layer.
             - 'act_params': Additional parameters for the activation function.
-            - 'C': The regularization term applied to the feature map matrix.
+            - 'C': The Tikhonov regularization term applied to the Gram matrix of the feature map.
             - 'is_orthogonalized': A boolean indicating whether the hidden layer weights have been orthogonalized.
+            - 'rank': The target rank of the randomized truncated SVD.
+            - 'dtype': The name of the data type of the layer computation.
+            - 'seed': The seed of the random input weights and bias.
             - 'beta': The output weights of the ELM layer.
             - 'alpha': The hidden layer weights of the ELM layer.
             - 'bias': The bias terms of the ELM layer.
@@ -328,9 +328,7 @@ class ML_ELMModel(BaseEstimator, ClassifierMixin):
         """
         x = tf.cast(x, dtype=tf.float32)
 
-        feature_map = x
-        for layer in self.layers[:-1]:
-            feature_map = layer.calc_output(feature_map)
+        feature_map = self._calc_hidden_output(x)
         feature_map = self.layers[-1].predict(feature_map)
 
         if self.classification:
@@ -397,11 +395,36 @@ class ML_ELMModel(BaseEstimator, ClassifierMixin):
             >>> pred_proba = model.predict_proba(X)
         """
         x = tf.cast(x, dtype=tf.float32)
+        feature_map = self._calc_hidden_output(x)
+        pred_prob = self.layers[-1].predict_proba(feature_map)
+        return pred_prob
+
+    def _calc_hidden_output(self, x):
+        """
+            Calculates the output of the hidden layers for the given input data. Consecutive ELM layers are evaluated
+            together as a single compiled chain, the other layers one by one.
+
+            Parameters:
+            -----------
+            - x (tf.Tensor): Input data tensor.
+
+            Returns:
+            -----------
+            tf.Tensor: Output tensor of the last hidden layer.
+        """
         feature_map = x
+        chain = []
         for layer in self.layers[:-1]:
+            if type(layer) is ELMLayer:
+                chain.append(layer)
+                continue
+            if chain:
+                feature_map = ELMLayer.calc_chain_output(chain, feature_map)
+                chain = []
             feature_map = layer.calc_output(feature_map)
-        pred_prob = self.layers[-1].predict_proba(feature_map)
-        return pred_prob
+        if chain:
+            feature_map = ELMLayer.calc_chain_output(chain, feature_map)
+        return feature_map
 
     def summary(self):
         """Print a summary of the model architecture and parameters."""
@@ -166,7 +166,7 @@ class ActivationFunction:
     # Parametric ReLU Function:
     def prelu(self, x):
         """Parametric Rectified Linear Unit (ReLU) function."""
-        return tf.keras.layers.PReLU(alpha_initializer=tf.constant_initializer(self.act_param))(x)
+        return tf.where(x >= 0.0, x, self.act_param * x)
 
     # Exponential Linear Unit (ELU) Function:
     def elu(self, x):
@@ -1,6 +1,7 @@
 import tensorflow as tf
 
 
+@tf.function(reduce_retracing=True)
 def apply_denoising(x, denoising, denoising_param):
     """
         Apply denoising to the input tensor.
@@ -0,0 +1,101 @@
+import numpy as np
+import tensorflow as tf
+
+
+def batched_cross_val_score(layer, X, y, cv, batch_size=10):
+    """
+        Evaluate the classification accuracy of an ELM layer with cross-validation, solving the output weights of all
+        folds at once.
+
+        The training sets of the folds are stacked into a single tensor of shape (B, N_fold, M), so that the feature
+        maps and the least squares problems of B folds are computed by single batched operations instead of one
+        fit per fold. Folds of unequal size, e.g. when the number of samples is not divisible by the number of
+        splits, are padded with zero rows of the feature map and of the targets, which leaves the solution unchanged.
+
+        Parameters:
+        -----------
+        - layer (ELMLayer): The ELM layer to be evaluated. It is built with new random weights for every fold, as
+          the layer of a cloned ELMModel would be.
+        - X (array-like): Feature matrix.
+        - y (array-like): Integer encoded class labels.
+        - cv: Cross-validation splitter providing split(X, y), e.g. KFold or RepeatedKFold.
+        - batch_size (int): Number of folds solved together. Default is 10, i.e. a single repeat of a 10-fold split.
+
+        Returns:
+        -----------
+        - np.ndarray: Accuracy obtained on the test set of each fold.
+
+        Notes:
+        -----------
+        - The output weights are obtained as in ELMLayer.fit, i.e. with the ridge solution when C is set and with
+          the Moore-Penrose pseudoinverse otherwise. Layers with a beta optimizer, receptive fields, constrained
+          weights or a rank limit are not supported.
+        - The memory needed is about batch_size times that of a single fit, since the feature maps of all folds of
+          a batch, of shape (batch_size, N_fold, number_neurons), and their decompositions are held at once. Lower
+          the batch size for large datasets or layers.
+
+        Example:
+        -----------
+        >>> layer = ELMLayer(number_neurons=1000, activation='mish')
+        >>> cv = RepeatedKFold(n_splits=10, n_repeats=50)
+        >>> scores = batched_cross_val_score(layer, X, y, cv)
+        >>> print(np.mean(scores))
+    """
+    if layer.beta_optimizer is not None or layer.receptive_field_generator is not None or layer.constrained \
+            or layer.rank is not None:
+        raise Exception("TypeError: Only plain ELM layers are supported by batched cross-validation")
+    y = np.asarray(y)
+    splits = list(cv.split(X, y))
+    X = tf.cast(X, dtype=layer.dtype)
+    T = tf.one_hot(y, depth=int(np.max(y)) + 1, dtype=tf.float32)
+    n_train = max(len(train) for train, _ in splits)
+    n_test = max(len(test) for _, test in splits)
+
+    scores = []
+    for start in range(0, len(splits), batch_size):
+        batch = splits[start:start + batch_size]
+        train_idx, train_mask = _pad_indices([train for train, _ in batch], n_train)
+        test_idx, test_mask = _pad_indices([test for _, test in batch], n_test)
+        train_weights = train_mask[..., np.newaxis].astype(np.float32)
+        alpha, bias = [], []
+        for _ in batch:
+            layer.build(X.shape)
+            alpha.append(layer.alpha)
+            bias.append(layer.bias)
+        alpha = tf.stack(alpha)
+        bias = tf.stack(bias)[:, tf.newaxis, :]
+
+        H = layer.activation(tf.matmul(tf.gather(X, train_idx), alpha) + bias)
+        H = tf.cast(H, dtype=tf.float32) * train_weights
+        T_train = tf.gather(T, train_idx) * train_weights
+        if layer.C:
+            beta = tf.linalg.lstsq(H, T_train, l2_regularizer=layer.C, fast=True)
+        else:
+            beta = tf.matmul(tf.linalg.pinv(H), T_train)
+
+        H_test = tf.cast(layer.activation(tf.matmul(tf.gather(X, test_idx), alpha) + bias), dtype=tf.float32)
+        pred = tf.argmax(tf.matmul(H_test, beta), axis=-1).numpy()
+        correct = (pred == y[test_idx]) & test_mask
+        scores.extend(np.sum(correct, axis=1) / np.sum(test_mask, axis=1))
+    return np.asarray(scores)
+
+
+def _pad_indices(indices, size):
+    """
+        Pad index arrays of unequal length to a common length.
+
+        Parameters:
+        -----------
+        - indices (list): Index arrays.
+        - size (int): Length of the padded arrays.
+
+        Returns:
+        -----------
+        - tuple: Padded indices of shape (B, size) and a boolean mask of the valid entries.
+    """
+    padded = np.zeros((len(indices), size), dtype=np.int64)
+    mask = np.zeros((len(indices), size), dtype=bool)
+    for i, idx in enumerate(indices):
+        padded[i, :len(idx)] = idx
+        mask[i, :len(idx)] = True
+    return padded, mask
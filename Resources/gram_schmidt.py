@@ -1,6 +1,7 @@
 import tensorflow as tf
 
 
+@tf.function
 def gram_schmidt(vectors, num_vectors=None):
     """
         Perform Gram-Schmidt orthogonalization on a set of vectors.
@@ -21,6 +22,8 @@ def gram_schmidt(vectors, num_vectors=None):
         Notes:
         -----------
         - The input tensors are assumed to have their vectors as the last dimension.
+        - The function is compiled to a graph, so that the orthogonalization loop runs as a single tf.while_loop
+          instead of one eager iteration per vector.
     """
     with tf.name_scope('gram_schmidt'):
         n = tf.shape(vectors)[-1]
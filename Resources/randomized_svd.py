@@ -0,0 +1,44 @@
+import tensorflow as tf
+
+
+def randomized_svd(A, rank, oversampling=10, seed=None):
+    """
+        Compute a truncated singular value decomposition with the randomized range finder of Halko et al.
+
+        The range of the matrix is sketched with a Gaussian test matrix, orthonormalized by QR and the exact SVD is
+        computed only on the small projected matrix, which reduces the cost from O(NM min(N, M)) of the full SVD to
+        O(NM (rank + oversampling)).
+
+        Parameters:
+        -----------
+        - A (tf.Tensor): Input matrix of shape (N, M).
+        - rank (int): Target rank of the decomposition.
+        - oversampling (int): Number of additional random samples used to improve the accuracy of the sketch.
+          Default is 10.
+        - seed (int): Seed of the random test matrix, if set the decomposition is deterministic. Default is None.
+
+        Returns:
+        -----------
+        tuple: Singular values of shape (k,), left singular vectors of shape (N, k) and right singular vectors of
+        shape (M, k), where k = min(rank, N, M), ordered as in tf.linalg.svd.
+
+        Notes:
+        -----------
+        - For wide matrices (N < M) the transposed matrix is decomposed, so that the QR factorization of the sketch
+          is always performed on a tall-thin matrix.
+    """
+    n, m = A.shape
+    if n < m:
+        s, v, u = randomized_svd(tf.transpose(A), rank, oversampling, seed)
+        return s, u, v
+    k = min(rank, m)
+    shape = (m, min(k + oversampling, m))
+    if seed is None:
+        omega = tf.random.normal(shape, dtype=A.dtype)
+    else:
+        omega = tf.random.stateless_normal(shape, seed=[seed, 2], dtype=A.dtype)
+    q, _ = tf.linalg.qr(tf.matmul(A, omega))
+    B = tf.matmul(q, A, transpose_a=True)
+    s, u_b, v = tf.linalg.svd(B)
+    u = tf.matmul(q, u_b)
+    return s[:k], u[:, :k], v[:, :k]